@@ -1,18 +1,26 @@
 import csv
 import ctypes
+import functools
+import io
 import os
+import queue
 import threading
 import tkinter as tk
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from tkinter import messagebox, ttk
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import requests
 import yfinance as yf
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.chart import LineChart, Reference
 from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import quote_sheetname
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from openpyxl.worksheet.worksheet import Worksheet
 
@@ -30,6 +38,9 @@ class Config:
     README_SHEET_NAME = "使い方・ABOUT"
     ICON_FILE = "icon.ico"
 
+    # この行数を超える見込みの場合、メモリを抑えたwrite-only方式で再構築する
+    WRITE_ONLY_ROW_THRESHOLD = 50_000
+
     # UI設定
     FONT_MAIN = ("Yu Gothic UI", 15)
     FONT_BOLD = ("Yu Gothic UI", 15, "bold")
@@ -63,8 +74,12 @@ class DataManager:
         os.makedirs(Config.DATA_DIR, exist_ok=True)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def load_jp_stock_master() -> Dict[str, str]:
-        """銘柄定義ファイルを読み込む。なければデフォルト作成。"""
+        """銘柄定義ファイルを読み込む。なければデフォルト作成。
+
+        結果はキャッシュされるため、ファイル読み込みは初回の1回のみ。
+        """
         master_path = os.path.join(Config.DATA_DIR, Config.JP_STOCKS_FILE)
 
         # デフォルト作成
@@ -78,51 +93,153 @@ class DataManager:
             except Exception:
                 return {}
 
-        # 読み込み（エンコーディング自動判別）
-        for enc in ["utf-8-sig", "cp932"]:
+        # バイナリで一括読み込みし、BOMの有無でエンコーディングを判別
+        # （パース後のUnicodeDecodeErrorによる二重パースを回避）
+        try:
+            with open(master_path, "rb") as f:
+                raw = f.read()
+        except Exception:
+            return {}
+
+        if raw.startswith(b"\xef\xbb\xbf"):
+            encodings = ["utf-8-sig"]
+        else:
+            encodings = ["utf-8-sig", "cp932"]
+
+        text = None
+        for enc in encodings:
             try:
-                with open(master_path, "r", encoding=enc) as f:
-                    reader = csv.DictReader(f)
-                    mapping = {}
-                    for row in reader:
-                        t, n = row.get("ticker"), row.get("name_ja")
-                        if t and n:
-                            mapping[t.strip()] = n.strip()
-                    return mapping
-            except (UnicodeDecodeError, Exception):
+                text = raw.decode(enc)
+                break
+            except UnicodeDecodeError:
                 continue
-        return {}
+        if text is None:
+            return {}
+
+        # DictReaderの行ごとのdict生成を避け、列indexで直接参照する
+        try:
+            reader = csv.reader(io.StringIO(text))
+            header = next(reader, None)
+            if not header:
+                return {}
+            ticker_idx = header.index("ticker")
+            name_idx = header.index("name_ja")
+            need = max(ticker_idx, name_idx)
+
+            mapping = {}
+            for row in reader:
+                if len(row) <= need:
+                    continue
+                t, n = row[ticker_idx].strip(), row[name_idx].strip()
+                if t and n:
+                    mapping[t] = n
+            return mapping
+        except Exception:
+            return {}
+
+    # Yahoo側のURL長制限を考慮した1リクエストあたりの銘柄数上限
+    YF_BATCH_SIZE = 20
+
+    # TCP/TLS接続を使い回すための共有セッション（requests.Sessionはスレッドセーフ）
+    _SESSION = requests.Session()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_ticker(ticker: str) -> yf.Ticker:
+        """Tickerオブジェクトを共有セッション付きでキャッシュ"""
+        return yf.Ticker(ticker, session=DataManager._SESSION)
+
+    @staticmethod
+    def _build_history_kwargs(
+        mode: int, date_range: Optional[Tuple[date, date]]
+    ) -> Dict[str, Any]:
+        """取得モードからyfinance呼び出し引数を組み立てる"""
+        kwargs: Dict[str, Any] = {"interval": "1d", "auto_adjust": False}
+        if mode == 4 and date_range:
+            kwargs["start"] = date_range[0].strftime("%Y-%m-%d")
+            kwargs["end"] = date_range[1].strftime("%Y-%m-%d")
+        else:
+            period_map = {1: "1d", 2: "1mo", 3: "3mo"}
+            kwargs["period"] = period_map.get(mode, "1d")
+        return kwargs
+
+    @staticmethod
+    def _moving_average(values: np.ndarray, window: int) -> np.ndarray:
+        """累積和による移動平均。先頭の window-1 要素はNaNで埋める。
+
+        rolling().mean() のウィンドウオブジェクト生成を避け、O(n)で計算する。
+        """
+        result = np.full(len(values), np.nan)
+        if len(values) < window:
+            return result
+        csum = np.concatenate(([0.0], np.cumsum(values)))
+        result[window - 1 :] = (csum[window:] - csum[:-window]) / window
+        return result
+
+    @staticmethod
+    def _finalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """タイムゾーン除去と移動平均の付与を行い書き込み用の形に整える"""
+        df = df.dropna(how="all")
+        if df.empty:
+            return pd.DataFrame()
+
+        if df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+
+        # 移動平均の計算
+        close = df["Close"].to_numpy(dtype=float)
+        df["MA5"] = DataManager._moving_average(close, 5)
+        df["MA25"] = DataManager._moving_average(close, 25)
+        return df
 
     @staticmethod
     def fetch_stock_data(
         ticker: str, mode: int, date_range: Optional[Tuple[date, date]]
     ) -> pd.DataFrame:
-        """Yahoo Financeから株価データを取得"""
+        """Yahoo Financeから株価データを取得（単一銘柄）"""
         try:
-            tkr = yf.Ticker(ticker)
-            kwargs = {"interval": "1d", "auto_adjust": False}
-
-            if mode == 4 and date_range:
-                kwargs["start"] = date_range[0].strftime("%Y-%m-%d")
-                kwargs["end"] = date_range[1].strftime("%Y-%m-%d")
-            else:
-                period_map = {1: "1d", 2: "1mo", 3: "3mo"}
-                kwargs["period"] = period_map.get(mode, "1d")
-
-            df = tkr.history(**kwargs)
+            tkr = DataManager._get_ticker(ticker)
+            df = tkr.history(**DataManager._build_history_kwargs(mode, date_range))
             if df.empty:
                 return pd.DataFrame()
-
-            if df.index.tz is not None:
-                df.index = df.index.tz_localize(None)
-
-            # 移動平均の計算
-            df["MA5"] = df["Close"].rolling(window=5).mean()
-            df["MA25"] = df["Close"].rolling(window=25).mean()
-            return df
+            return DataManager._finalize_frame(df)
         except Exception:
             return pd.DataFrame()
 
+    @staticmethod
+    def fetch_stock_data_batch(
+        tickers: List[str], mode: int, date_range: Optional[Tuple[date, date]]
+    ) -> Dict[str, pd.DataFrame]:
+        """Yahoo Financeから複数銘柄を一括取得し、銘柄ごとのDataFrameに分割"""
+        empty = {t: pd.DataFrame() for t in tickers}
+        try:
+            raw = yf.download(
+                tickers=" ".join(tickers),
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                session=DataManager._SESSION,
+                **DataManager._build_history_kwargs(mode, date_range),
+            )
+        except Exception:
+            return empty
+        if raw is None or raw.empty:
+            return empty
+
+        result = {}
+        for t in tickers:
+            if isinstance(raw.columns, pd.MultiIndex):
+                try:
+                    part = raw.xs(t, axis=1, level=0)
+                except KeyError:
+                    result[t] = pd.DataFrame()
+                    continue
+            else:
+                # 1銘柄のみの場合はフラットな列で返ってくる
+                part = raw
+            result[t] = DataManager._finalize_frame(part.copy())
+        return result
+
 
 # ==========================================
 #  Excel操作ロジック (Excel Handler)
@@ -130,26 +247,49 @@ class DataManager:
 class ExcelHandler:
     """OpenPyXLを使用したExcel操作を集約"""
 
+    # スタイル定義（openpyxlのスタイルオブジェクトは不変なので共有・再利用する）
+    TITLE_FONT = Font(size=14, bold=True, color="000080")
+    HEADER_FONT = Font(bold=True, color="FFFFFF")
+    HEADER_FILL = PatternFill(
+        start_color="808080", end_color="808080", fill_type="solid"
+    )
+    HEADER_ALIGNMENT = Alignment(horizontal="center")
+    README_FONTS = {
+        "Title": Font(size=14, bold=True, color="000080"),
+        "Header": Font(size=11, bold=True, color="000000"),
+        "Normal": Font(size=10, color="333333"),
+        "Alert": Font(size=10, bold=True, color="FF0000"),
+        "Small": Font(size=9, color="888888"),
+    }
+    README_HEADER_FILL = PatternFill(
+        start_color="EEEEEE", end_color="EEEEEE", fill_type="solid"
+    )
+
+    DATA_HEADERS = (
+        "日付",
+        "終値",
+        "始値",
+        "高値",
+        "安値",
+        "5日移動平均",
+        "25日移動平均",
+    )
+    DATA_COLUMN_WIDTHS = {"A": 15, "B": 12, "C": 12, "D": 12, "E": 12, "F": 14, "G": 14}
+    NUMERIC_COLUMNS = ("B", "C", "D", "E", "F", "G")
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def build_sheet_name(ticker: str, name_ja: str) -> str:
-        """Excelシート名に使用できない文字を除外して生成"""
+        """Excelシート名に使用できない文字を除外して生成（結果はキャッシュ）"""
         base = f"{ticker}_{name_ja}" if name_ja else ticker
         for bad in (":", "\\", "/", "?", "*", "[", "]"):
             base = base.replace(bad, "_")
         return base[:31]  # Excelの制限
 
     @staticmethod
-    def create_readme_sheet(wb: Workbook):
-        """使い方・免責事項シートの作成"""
-        if Config.README_SHEET_NAME in wb.sheetnames:
-            ws = wb[Config.README_SHEET_NAME]
-        else:
-            ws = wb.create_sheet(title=Config.README_SHEET_NAME, index=0)
-
-        ws.sheet_properties.tabColor = "FF9900"
-
-        # コンテンツ定義
-        info_text = [
+    def _readme_lines() -> List[Tuple[str, str]]:
+        """使い方・免責事項シートのコンテンツ定義"""
+        return [
             ("【株価自動追記ツール】", "Title"),
             ("", ""),
             ("■ このファイルについて", "Header"),
@@ -183,24 +323,23 @@ class ExcelHandler:
             (f"最終更新日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "Small"),
         ]
 
-        # スタイル定義
-        fonts = {
-            "Title": Font(size=14, bold=True, color="000080"),
-            "Header": Font(size=11, bold=True, color="000000"),
-            "Normal": Font(size=10, color="333333"),
-            "Alert": Font(size=10, bold=True, color="FF0000"),
-            "Small": Font(size=9, color="888888"),
-        }
-        header_fill = PatternFill(
-            start_color="EEEEEE", end_color="EEEEEE", fill_type="solid"
-        )
+    @staticmethod
+    def create_readme_sheet(wb: Workbook):
+        """使い方・免責事項シートの作成"""
+        if Config.README_SHEET_NAME in wb.sheetnames:
+            ws = wb[Config.README_SHEET_NAME]
+        else:
+            ws = wb.create_sheet(title=Config.README_SHEET_NAME, index=0)
+
+        ws.sheet_properties.tabColor = "FF9900"
 
-        for i, (text, style_key) in enumerate(info_text, start=1):
+        fonts = ExcelHandler.README_FONTS
+        for i, (text, style_key) in enumerate(ExcelHandler._readme_lines(), start=1):
             cell = ws.cell(row=i, column=2)
             cell.value = text
             cell.font = fonts.get(style_key, fonts["Normal"])
             if style_key == "Header":
-                cell.fill = header_fill
+                cell.fill = ExcelHandler.README_HEADER_FILL
 
         ws.column_dimensions["A"].width = 2
         ws.column_dimensions["B"].width = 80
@@ -208,131 +347,173 @@ class ExcelHandler:
     @staticmethod
     def setup_worksheet_header(ws: Worksheet, ticker: str, name_ja: str):
         """シートヘッダーの初期設定（A1タイトル、3行目テーブルヘッダー）"""
+        # 数値列は列単位で表示形式を設定（セル単位の書式指定を不要にする）。
+        # 旧バージョンで作成されたシートにも適用するため、初期化済みでも毎回設定する
+        for col in ExcelHandler.NUMERIC_COLUMNS:
+            ws.column_dimensions[col].number_format = "#,##0"
+
         if ws["A3"].value is not None:
             return
 
         # タイトル
         ws["A1"] = f"{ticker} : {name_ja}"
-        ws["A1"].font = Font(size=14, bold=True, color="000080")
+        ws["A1"].font = ExcelHandler.TITLE_FONT
         ws.merge_cells("A1:D1")
 
         # テーブルヘッダー
-        headers = [
-            "日付",
-            "終値",
-            "始値",
-            "高値",
-            "安値",
-            "5日移動平均",
-            "25日移動平均",
-        ]
-        for col_idx, header in enumerate(headers, 1):
+        for col_idx, header in enumerate(ExcelHandler.DATA_HEADERS, 1):
             cell = ws.cell(row=3, column=col_idx, value=header)
-            cell.alignment = Alignment(horizontal="center")
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(
-                start_color="808080", end_color="808080", fill_type="solid"
-            )
+            cell.alignment = ExcelHandler.HEADER_ALIGNMENT
+            cell.font = ExcelHandler.HEADER_FONT
+            cell.fill = ExcelHandler.HEADER_FILL
 
         # 列幅設定
-        widths = {"A": 15, "B": 12, "C": 12, "D": 12, "E": 12, "F": 14, "G": 14}
-        for col, width in widths.items():
+        for col, width in ExcelHandler.DATA_COLUMN_WIDTHS.items():
             ws.column_dimensions[col].width = width
 
+    @staticmethod
+    def _parse_column_dates(raw_values: List[Any]) -> List[Optional[date]]:
+        """セル値のリストをまとめて日付キーに変換（不正値はNone）。
+
+        pandasのC実装パーサーで一括変換し、行ごとのstrptime呼び出しを避ける。
+        """
+        if not raw_values:
+            return []
+        # 数値などはエポック秒として解釈されてしまうため、日付・文字列以外はNone扱い
+        cleaned = [
+            v.replace("/", "-").split(" ")[0]
+            if isinstance(v, str)
+            else (v if isinstance(v, (datetime, date)) else None)
+            for v in raw_values
+        ]
+        parsed = pd.to_datetime(
+            pd.Series(cleaned), errors="coerce", format="mixed", cache=True
+        )
+        return [None if pd.isna(ts) else ts.date() for ts in parsed]
+
+    @staticmethod
+    def _df_to_rows(df: pd.DataFrame) -> List[Tuple]:
+        """DataFrameをシート書き込み用の行タプル列に変換。
+
+        iterrows()は1行ごとにSeriesを生成するため長期間データで遅く、
+        列単位でndarrayに落としてからzipで束ねる。
+        """
+        return list(
+            zip(
+                df.index.date,
+                df["Close"].to_numpy(dtype=float).tolist(),
+                df["Open"].to_numpy(dtype=float).tolist(),
+                df["High"].to_numpy(dtype=float).tolist(),
+                df["Low"].to_numpy(dtype=float).tolist(),
+                df["MA5"].to_numpy(dtype=float).tolist(),
+                df["MA25"].to_numpy(dtype=float).tolist(),
+            )
+        )
+
+    @staticmethod
+    def _truncate_rows(ws: Worksheet, first_row: int):
+        """first_row以降の行を末尾まで切り詰める。
+
+        delete_rows()は削除位置以降の全セルの座標振り直しを行うが、
+        末尾の切り詰めでは再配置が不要なため_cellsから直接取り除く。
+        """
+        stale = [key for key in ws._cells if key[0] >= first_row]
+        for key in stale:
+            del ws._cells[key]
+        for r in [r for r in ws.row_dimensions if r >= first_row]:
+            del ws.row_dimensions[r]
+        # append()が正しい位置から再開できるよう書き込みカーソルも戻す
+        ws._current_row = min(ws._current_row, first_row - 1)
+
     @staticmethod
     def merge_and_write_data(ws: Worksheet, df: pd.DataFrame):
         """既存データを読み込み、新規データをマージして書き込む"""
-        # 1. 既存データ読み込み
-        data_map = {}
-        for row in ws.iter_rows(min_row=4, values_only=True):
-            raw_val = row[0]
-            if not raw_val:
-                continue
+        new_rows = ExcelHandler._df_to_rows(df)
+        if not new_rows:
+            return
+        had_existing_rows = ws.max_row >= 4
 
-            d_key = None
-            if isinstance(raw_val, datetime):
-                d_key = raw_val.date()
-            elif isinstance(raw_val, date):
-                d_key = raw_val
-            elif isinstance(raw_val, str):
-                try:
-                    d_key = datetime.strptime(
-                        raw_val.replace("/", "-").split(" ")[0], "%Y-%m-%d"
-                    ).date()
-                except:
-                    pass
-
-            if d_key:
-                row_list = list(row)
-                row_list[0] = d_key
-                data_map[d_key] = row_list
-
-        # 2. マージ処理
-        for dt_idx, row in df.iterrows():
-            d = dt_idx.date()
-            new_row = [
-                d,
-                float(row["Close"]),
-                float(row["Open"]),
-                float(row["High"]),
-                float(row["Low"]),
-                row["MA5"],
-                row["MA25"],
-            ]
-            data_map[d] = new_row  # 上書きまたは新規追加
+        # 新規シートはappendで一括書き込み（セル単位のcell()呼び出しより高速）
+        if not had_existing_rows:
+            for values in new_rows:
+                ws.append(values)
+            return
 
-        # 3. ソートと書き込み
-        sorted_dates = sorted(data_map.keys())
-        current_row = 4
-        number_format = "#,##0"
+        # 1. 既存データ読み込み（まず日付列のみ走査し、pandasで一括パース）
+        existing_dates = ExcelHandler._parse_column_dates(
+            [row[0] for row in ws.iter_rows(min_row=4, max_col=1, values_only=True)]
+        )
+
+        # 純粋な追記で済むなら既存行のマージ・書き直しを省略
+        # （日次更新では新規1行の追加が典型で、既存行は一切触る必要がない）
+        valid_dates = [d for d in existing_dates if d is not None]
+        if valid_dates and new_rows[0][0] > max(valid_dates):
+            for values in new_rows:
+                ws.append(values)
+            return
+
+        # 新データで上書きされる行は読む必要がないため、保持すべき行だけ全列を読む
+        # （キーは日付の通算日(int)。ソートがC実装のint比較で済む）
+        new_date_ords = {values[0].toordinal() for values in new_rows}
+        data_map = {}
+        for r_idx, d_key in enumerate(existing_dates, start=4):
+            if d_key and d_key.toordinal() not in new_date_ords:
+                data_map[d_key.toordinal()] = (d_key,) + tuple(
+                    ws.cell(row=r_idx, column=c).value for c in range(2, 8)
+                )
 
-        for d in sorted_dates:
-            values = data_map[d]
-            for col_idx, val in enumerate(values, 1):
-                cell = ws.cell(row=current_row, column=col_idx, value=val)
-                if col_idx > 1 and isinstance(val, (int, float)):
-                    cell.number_format = number_format
-            current_row += 1
+        # 2. マージ処理（上書きまたは新規追加）
+        for values in new_rows:
+            data_map[values[0].toordinal()] = values
 
-        # 余剰行削除
-        if ws.max_row >= current_row:
-            ws.delete_rows(current_row, ws.max_row - current_row + 1)
+        # 3. ソートと書き込み（数値の表示形式は列単位で設定済み）
+        # 既存データ行を一括クリアしてから行単位でappend
+        # （ws.cell()のセル毎の座標解決を回避し、余剰行削除も不要になる）
+        sorted_rows = [data_map[o] for o in sorted(data_map)]
+        ExcelHandler._truncate_rows(ws, 4)
+        for values in sorted_rows:
+            ws.append(values)
 
     @staticmethod
-    def ensure_table_and_chart(ws: Worksheet, sheet_name: str):
-        """テーブル化とグラフの更新"""
-        max_row = ws.max_row
-        if max_row < 3:
-            return
+    def _chart_title_text(chart) -> Optional[str]:
+        """グラフタイトルを文字列として取り出す（読み込み後はTitleオブジェクトになるため）"""
+        title = chart.title
+        if title is None:
+            return None
+        if isinstance(title, str):
+            return title
+        try:
+            return "".join(
+                r.t or "" for p in title.tx.rich.p for r in (p.r or [])
+            )
+        except AttributeError:
+            return None
 
-        # テーブル設定
+    @staticmethod
+    def _build_table_name(sheet_name: str) -> str:
+        """シート名からテーブル名（displayName）を生成"""
         safe_name = sheet_name.replace(" ", "_").replace(".", "_").replace("-", "_")
         if safe_name[0].isdigit():
             safe_name = "tbl_" + safe_name
-        table_name = safe_name[:255]
-
-        table_ref = f"A3:G{max_row}"
+        return safe_name[:255]
 
-        # 既存テーブル確認
-        found_tbl = next(
-            (tbl for tbl in ws.tables.values() if tbl.displayName == table_name), None
+    @staticmethod
+    def _make_table(sheet_name: str, max_row: int) -> Table:
+        """データ範囲のテーブルオブジェクトを生成"""
+        new_table = Table(
+            displayName=ExcelHandler._build_table_name(sheet_name),
+            ref=f"A3:G{max_row}",
         )
-        if found_tbl:
-            found_tbl.ref = table_ref
-        else:
-            new_table = Table(displayName=table_name, ref=table_ref)
-            new_table.tableStyleInfo = TableStyleInfo(
-                name="TableStyleMedium2", showRowStripes=True, showColumnStripes=False
-            )
-            ws.add_table(new_table)
-
-        # グラフ更新
-        chart_title = f"{sheet_name} 株価推移"
-        # 既存グラフ削除（同じタイトルのもの）
-        ws._charts = [c for c in ws._charts if c.title != chart_title]
+        new_table.tableStyleInfo = TableStyleInfo(
+            name="TableStyleMedium2", showRowStripes=True, showColumnStripes=False
+        )
+        return new_table
 
+    @staticmethod
+    def _make_chart(ws, sheet_name: str, max_row: int) -> LineChart:
+        """終値・移動平均の折れ線グラフを生成"""
         chart = LineChart()
-        chart.title = chart_title
+        chart.title = f"{sheet_name} 株価推移"
         chart.style = 2
         chart.y_axis.title = "株価"
         chart.x_axis.title = "日付"
@@ -348,7 +529,186 @@ class ExcelHandler:
         chart.add_data(data_ma5, titles_from_data=True)
         chart.add_data(data_ma25, titles_from_data=True)
         chart.set_categories(cats)
-        ws.add_chart(chart, "I3")
+        return chart
+
+    @staticmethod
+    def ensure_table_and_chart(ws: Worksheet, sheet_name: str):
+        """テーブル化とグラフの更新"""
+        max_row = ws.max_row
+        if max_row < 3:
+            return
+
+        # 既存テーブル確認（displayNameをキーに直接参照）
+        table_name = ExcelHandler._build_table_name(sheet_name)
+        found_tbl = ws.tables.get(table_name)
+        if found_tbl:
+            found_tbl.ref = f"A3:G{max_row}"
+        else:
+            ws.add_table(ExcelHandler._make_table(sheet_name, max_row))
+
+        # グラフ更新
+        chart_title = f"{sheet_name} 株価推移"
+        existing_chart = None
+        chart_idx = -1
+        for i, c in enumerate(ws._charts):
+            if ExcelHandler._chart_title_text(c) == chart_title:
+                existing_chart = c
+                chart_idx = i
+                break
+
+        # 既存グラフがあれば参照範囲の行数だけ更新（再生成によるXML churnを回避）
+        if existing_chart is not None and len(existing_chart.series) == 3:
+            # 系列タイトルは3行目のまま、データ範囲は4行目〜最終行
+            sheet_ref = quote_sheetname(ws.title)
+            for ser, col in zip(existing_chart.series, ("B", "F", "G")):
+                if ser.val is not None and ser.val.numRef is not None:
+                    ser.val.numRef.f = f"{sheet_ref}!${col}$4:${col}${max_row}"
+                if ser.cat is not None and ser.cat.numRef is not None:
+                    ser.cat.numRef.f = f"{sheet_ref}!$A$4:$A${max_row}"
+            return
+
+        # 更新できない形のグラフは作り直す
+        if chart_idx >= 0:
+            del ws._charts[chart_idx]
+
+        ws.add_chart(ExcelHandler._make_chart(ws, sheet_name, max_row), "I3")
+
+
+    @staticmethod
+    def estimate_new_rows(mode: int, date_range: Optional[Tuple[date, date]]) -> int:
+        """取得モードから1銘柄あたりの新規行数を概算"""
+        if mode == 4 and date_range:
+            return max((date_range[1] - date_range[0]).days + 1, 1)
+        # 営業日ベースのおおよその行数
+        return {1: 1, 2: 23, 3: 66}.get(mode, 1)
+
+    @staticmethod
+    def rebuild_write_only(
+        wb: Workbook, frames: Dict[str, pd.DataFrame], name_map: Dict[str, str]
+    ) -> Workbook:
+        """既存ワークブックと新規データからwrite-only形式で再構築する。
+
+        行数が膨大な場合、編集モードのセルオブジェクト保持よりも
+        行ストリーム書き出しの方がメモリ・保存時間とも有利。
+        セル結合など一部の装飾はwrite-onlyでは再現できないため省略する。
+        """
+        out = Workbook(write_only=True)
+
+        # READMEシート（write-onlyでは列幅は最初のappend前に設定する）
+        ws_readme = out.create_sheet(Config.README_SHEET_NAME)
+        ws_readme.sheet_properties.tabColor = "FF9900"
+        ws_readme.column_dimensions["A"].width = 2
+        ws_readme.column_dimensions["B"].width = 80
+        fonts = ExcelHandler.README_FONTS
+        for text, style_key in ExcelHandler._readme_lines():
+            cell = WriteOnlyCell(ws_readme, value=text)
+            cell.font = fonts.get(style_key, fonts["Normal"])
+            if style_key == "Header":
+                cell.fill = ExcelHandler.README_HEADER_FILL
+            ws_readme.append([None, cell])
+
+        # シート名 -> 銘柄コードの逆引き（旧形式のコードそのままのシート名も拾う）。
+        # 今回未取得の銘柄シートも銘柄シートとして再構築するため、全既知銘柄を対象にする
+        known_tickers = dict(name_map)
+        for ticker in frames:
+            known_tickers.setdefault(ticker, "")
+        sheet_to_ticker = {}
+        for ticker, name_ja in known_tickers.items():
+            sheet_to_ticker[ExcelHandler.build_sheet_name(ticker, name_ja)] = ticker
+            sheet_to_ticker.setdefault(ticker, ticker)
+
+        written_tickers = set()
+        for src in wb.worksheets:
+            if src.title == Config.README_SHEET_NAME:
+                continue
+
+            ticker = sheet_to_ticker.get(src.title)
+            if not ticker:
+                # 対象外シート（ユーザー作成シート等）は行をそのまま書き写す
+                ws_out = out.create_sheet(src.title)
+                for row in src.iter_rows(values_only=True):
+                    ws_out.append(row)
+                continue
+
+            written_tickers.add(ticker)
+            df = frames.get(ticker, pd.DataFrame())
+
+            # 既存行と新規データのマージ（merge_and_write_dataと同じキー方式）
+            data_map = {}
+            existing_dates = ExcelHandler._parse_column_dates(
+                [
+                    row[0]
+                    for row in src.iter_rows(min_row=4, max_col=1, values_only=True)
+                ]
+            )
+            for r_idx, d_key in enumerate(existing_dates, start=4):
+                if d_key:
+                    data_map[d_key.toordinal()] = (d_key,) + tuple(
+                        src.cell(row=r_idx, column=c).value for c in range(2, 8)
+                    )
+            if not df.empty:
+                for values in ExcelHandler._df_to_rows(df):
+                    data_map[values[0].toordinal()] = values
+
+            ExcelHandler._write_only_ticker_sheet(
+                out, ticker, name_map.get(ticker, ""), data_map
+            )
+
+        # 既存シートのない新規銘柄のデータもシートを作って書き出す
+        for ticker, df in frames.items():
+            if ticker in written_tickers or df.empty:
+                continue
+            data_map = {
+                values[0].toordinal(): values
+                for values in ExcelHandler._df_to_rows(df)
+            }
+            ExcelHandler._write_only_ticker_sheet(
+                out, ticker, name_map.get(ticker, ""), data_map
+            )
+
+        return out
+
+    @staticmethod
+    def _write_only_ticker_sheet(
+        out: Workbook, ticker: str, name_ja: str, data_map: Dict[int, Tuple]
+    ):
+        """write-onlyワークブックに銘柄シート1枚を書き出す"""
+        title = ExcelHandler.build_sheet_name(ticker, name_ja)
+        ws_out = out.create_sheet(title)
+
+        # 列幅・数値書式（write-onlyでは最初のappend前に設定する必要がある）
+        for col, width in ExcelHandler.DATA_COLUMN_WIDTHS.items():
+            ws_out.column_dimensions[col].width = width
+        for col in ExcelHandler.NUMERIC_COLUMNS:
+            ws_out.column_dimensions[col].number_format = "#,##0"
+
+        # タイトル・空行・テーブルヘッダー
+        head_cell = WriteOnlyCell(ws_out, value=f"{ticker} : {name_ja}")
+        head_cell.font = ExcelHandler.TITLE_FONT
+        ws_out.append([head_cell])
+        ws_out.append([])
+        header_cells = []
+        for header in ExcelHandler.DATA_HEADERS:
+            cell = WriteOnlyCell(ws_out, value=header)
+            cell.alignment = ExcelHandler.HEADER_ALIGNMENT
+            cell.font = ExcelHandler.HEADER_FONT
+            cell.fill = ExcelHandler.HEADER_FILL
+            header_cells.append(cell)
+        ws_out.append(header_cells)
+
+        max_row = 3
+        for ord_ in sorted(data_map):
+            ws_out.append(data_map[ord_])
+            max_row += 1
+
+        if max_row > 3:
+            # write-onlyではヘッダーセルを参照できないため列定義を明示する
+            table = ExcelHandler._make_table(title, max_row)
+            table._initialise_columns()
+            for column, header in zip(table.tableColumns, ExcelHandler.DATA_HEADERS):
+                column.name = header
+            ws_out.add_table(table)
+            ws_out.add_chart(ExcelHandler._make_chart(ws_out, title, max_row), "I3")
 
 
 # ==========================================
@@ -646,31 +1006,70 @@ class StockLoggerApp:
             total = len(target_tickers)
             self.log_safe(f"▶ 対象: {total} 銘柄")
 
-            for i, ticker in enumerate(target_tickers):
-                progress = (i / total) * 100
-                self.status_safe(f"データ取得中... ({i+1}/{total}): {ticker}", progress)
+            # 見込み行数が閾値を超える場合は省メモリなwrite-only再構築に切り替える
+            est_rows = sum(
+                wb[s].max_row
+                for s in wb.sheetnames
+                if s != Config.README_SHEET_NAME
+            ) + total * ExcelHandler.estimate_new_rows(mode, d_range)
+            use_write_only = est_rows > Config.WRITE_ONLY_ROW_THRESHOLD
+            collected_frames: Dict[str, pd.DataFrame] = {}
+            if use_write_only:
+                self.log_safe(
+                    f"▶ 大量データ見込み（約{est_rows}行）のため省メモリモードで再構築します"
+                )
 
-                df = DataManager.fetch_stock_data(ticker, mode, d_range)
-                if df.empty:
-                    self.log_safe(f"  [Skip] {ticker}: データなし")
-                    continue
+            # 一括ダウンロードでHTTP往復を削減しつつ、バッチ単位で並列化。
+            # 取得スレッド(producer)が結果をキューに流し、このスレッド(consumer)が
+            # 取り出し次第Excelへ書き込む。通信待ちと書き込み処理が重なり合う。
+            batch_size = DataManager.YF_BATCH_SIZE
+            batches = [
+                target_tickers[i : i + batch_size]
+                for i in range(0, total, batch_size)
+            ]
+            results_queue: queue.Queue = queue.Queue()
 
-                name_ja = self.name_map.get(ticker, "")
-                sheet_name = ExcelHandler.build_sheet_name(ticker, name_ja)
-                self.log_safe(f"  [OK] {ticker} -> {sheet_name}")
+            def produce_batch(batch):
+                try:
+                    results = DataManager.fetch_stock_data_batch(
+                        batch, mode, d_range
+                    )
+                except Exception:
+                    results = {t: pd.DataFrame() for t in batch}
+                for item in results.items():
+                    results_queue.put(item)
+
+            done_count = 0
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(batches))
+            ) as executor:
+                for batch in batches:
+                    executor.submit(produce_batch, batch)
+
+                while done_count < total:
+                    ticker, df = results_queue.get()
+                    done_count += 1
+                    progress = (done_count / total) * 90
+                    self.status_safe(
+                        f"データ取得中... ({done_count}/{total}): {ticker}",
+                        progress,
+                    )
 
-                # シート取得または作成
-                if sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                elif ticker in wb.sheetnames:
-                    ws = wb[ticker]
-                    ws.title = sheet_name
-                else:
-                    ws = wb.create_sheet(title=sheet_name)
+                    if df.empty:
+                        self.log_safe(f"  [Skip] {ticker}: データなし")
+                        continue
 
-                ExcelHandler.setup_worksheet_header(ws, ticker, name_ja)
-                ExcelHandler.merge_and_write_data(ws, df)
-                ExcelHandler.ensure_table_and_chart(ws, sheet_name)
+                    if use_write_only:
+                        collected_frames[ticker] = df
+                        self.log_safe(f"  [OK] {ticker}: 取得完了")
+                    else:
+                        self.write_ticker_sheet(wb, ticker, df)
+
+            if use_write_only:
+                self.status_safe("ワークブックを再構築しています...", 92)
+                wb = ExcelHandler.rebuild_write_only(
+                    wb, collected_frames, self.name_map
+                )
 
             self.status_safe("Excelファイルを保存しています...", 95)
             if self.save_workbook_safely(wb, excel_path):
@@ -685,6 +1084,25 @@ class StockLoggerApp:
         finally:
             self.finalize_ui()
 
+    def write_ticker_sheet(self, wb: Workbook, ticker: str, df: pd.DataFrame):
+        """取得済みデータを対象シートへマージ書き込み（openpyxlは非スレッドセーフのため直列実行）"""
+        name_ja = self.name_map.get(ticker, "")
+        sheet_name = ExcelHandler.build_sheet_name(ticker, name_ja)
+        self.log_safe(f"  [OK] {ticker} -> {sheet_name}")
+
+        # シート取得または作成
+        if sheet_name in wb.sheetnames:
+            ws = wb[sheet_name]
+        elif ticker in wb.sheetnames:
+            ws = wb[ticker]
+            ws.title = sheet_name
+        else:
+            ws = wb.create_sheet(title=sheet_name)
+
+        ExcelHandler.setup_worksheet_header(ws, ticker, name_ja)
+        ExcelHandler.merge_and_write_data(ws, df)
+        ExcelHandler.ensure_table_and_chart(ws, sheet_name)
+
     def finalize_ui(self):
         self.root.after(0, lambda: self.btn_run.config(state="normal"))
 
@@ -707,20 +1125,40 @@ class StockLoggerApp:
 
     def save_workbook_safely(self, wb, path):
         while True:
-            try:
-                wb.save(path)
+            # 保存は別スレッドで実行し、待ち時間中もステータス表示を更新し続ける
+            errors = []
+
+            def _do_save():
+                try:
+                    wb.save(path)
+                except Exception as e:
+                    errors.append(e)
+
+            saver = threading.Thread(target=_do_save, daemon=True)
+            saver.start()
+            dots = 0
+            while saver.is_alive():
+                dots = (dots % 3) + 1
+                self.status_safe(f"Excelファイルを保存しています{'.' * dots}", 95)
+                saver.join(timeout=0.3)
+
+            if not errors:
                 messagebox.showinfo(
                     "完了",
                     "データの更新が完了しました！\nExcelファイルを開いて確認してください。",
                 )
                 return True
-            except PermissionError:
+
+            if isinstance(errors[0], PermissionError):
                 if not messagebox.askretrycancel(
                     "保存できません",
                     "Excelファイルが開かれているため保存できません。\n閉じてから「再試行」を押してください。",
                 ):
                     self.log_safe("保存をキャンセルしました。")
                     return False
+            else:
+                # PermissionError以外はrun_logic側の例外ハンドラに委ねる
+                raise errors[0]
 
 
 if __name__ == "__main__":